@@ -0,0 +1,56 @@
+# Copyright 2018-2020 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Observable sampling benchmark.
+"""
+# pylint: disable=invalid-name
+import numpy as np
+
+import pennylane as qml
+
+import benchmark_utils as bu
+
+A = np.array([[1.0, 0.5], [0.5, -1.0]])
+
+
+def circuit(n_wires):
+    """Circuit sampling a non-Pauli tensor observable, which maps the sampled
+    basis states onto eigenvalues."""
+    for w in range(n_wires):
+        qml.Hadamard(wires=w)
+    for w in range(n_wires - 1):
+        qml.CNOT(wires=[w, w + 1])
+    return qml.sample(qml.PauliZ(0) @ qml.Hermitian(A, wires=n_wires - 1))
+
+
+class Benchmark(bu.BaseBenchmark):
+    """Observable sampling benchmark.
+
+    Creates a non-analytic device and samples a tensor observable
+    containing a Hermitian factor for an increasing number of shots.
+    """
+
+    name = "Observable sampling"
+    min_wires = 2
+    n_vals = [1000, 10000, 100000]
+
+    def benchmark(self, n=10000):
+        # n is the number of shots
+        if self.verbose:
+            print("circuit: {} shots, {} wires".format(n, self.n_wires))
+
+        dev = qml.device(self.device.short_name, wires=self.n_wires, shots=n, analytic=False)
+        qnode = bu.create_qnode(lambda: circuit(self.n_wires), dev)
+        qnode()
+        return True
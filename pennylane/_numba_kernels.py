@@ -0,0 +1,59 @@
+# Copyright 2018-2020 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+This module contains Numba-compiled kernels used by the :class:`QubitDevice` class.
+
+Numba is an optional dependency, and this module is only imported the first
+time one of its kernels is required.
+"""
+import numpy as np
+from numba import get_num_threads, njit, prange
+
+
+def hist_from_bits(bits, num_wires, shots):
+    """Count the occurrences of each computational basis state in the samples.
+
+    The samples are split into chunks that are counted into separate histograms
+    in parallel, which are summed at the end. The number of chunks is at most the
+    number of threads used by Numba, and limited such that the histograms contain
+    at most as many entries as there are samples.
+
+    Args:
+        bits (array[int]): samples of basis states in binary representation,
+            of shape ``(shots, num_wires)``
+        num_wires (int): the number of wires
+        shots (int): the number of samples
+
+    Returns:
+        array[int]: the number of occurrences of each basis state
+    """
+    num_chunks = max(1, min(get_num_threads(), shots // 2 ** num_wires))
+    return _chunked_hist_from_bits(bits, num_wires, shots, num_chunks)
+
+
+@njit(parallel=True, cache=True)
+def _chunked_hist_from_bits(bits, num_wires, shots, num_chunks):
+    """Count the occurrences of each computational basis state in the samples,
+    using a separate histogram for each of ``num_chunks`` chunks of the samples."""
+    chunk_size = (shots + num_chunks - 1) // num_chunks
+    hist = np.zeros((num_chunks, 2 ** num_wires), dtype=np.int64)
+
+    for chunk in prange(num_chunks):  # pylint: disable=not-an-iterable
+        for shot in range(chunk * chunk_size, min((chunk + 1) * chunk_size, shots)):
+            index = 0
+            for wire in range(num_wires):
+                index = (index << 1) | bits[shot, wire]
+            hist[chunk, index] += 1
+
+    return hist.sum(axis=0)
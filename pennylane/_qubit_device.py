@@ -20,6 +20,7 @@ This module contains the :class:`QubitDevice` abstract base class.
 # pylint: disable=arguments-differ, abstract-method, no-value-for-parameter,too-many-instance-attributes
 import abc
 from collections import OrderedDict
+import functools
 import itertools
 
 import numpy as np
@@ -27,8 +28,142 @@ import numpy as np
 from pennylane.operation import Sample, Variance, Expectation, Probability, State
 from pennylane.qnodes import QuantumFunctionError
 from pennylane import Device
+from pennylane.variable import Variable
 from pennylane.wires import Wires
 
+# single-qubit observables with eigenvalues {1, -1}
+_PAULI_OBSERVABLES = frozenset({"PauliX", "PauliY", "PauliZ", "Hadamard"})
+
+# minimum number of samples for which probabilities are estimated using the
+# Numba-compiled histogram returned by _numba_hist_from_bits, provided that they
+# exceed the number of basis states
+_NUMBA_MIN_SHOTS = 1024
+
+
+@functools.lru_cache(maxsize=64)
+def _powers_of_two(num_bits):
+    """Return the place values of a binary number with the most significant bit first.
+
+    The returned array is cached, and therefore read-only.
+
+    The powers are stored using the smallest unsigned integer type able to
+    represent a ``num_bits``-bit number, falling back to ``int64`` beyond
+    32 bits so that the packed samples remain valid for ``np.bincount``.
+
+    Args:
+        num_bits (int): the number of bits
+
+    Returns:
+        array[int]: the powers of two ``[2 ** (num_bits - 1), ..., 2, 1]``
+    """
+    dtype = np.min_scalar_type(2 ** num_bits - 1) if num_bits <= 32 else np.int64
+    powers_of_two = (1 << np.arange(num_bits - 1, -1, -1, dtype=np.int64)).astype(dtype)
+    powers_of_two.setflags(write=False)
+    return powers_of_two
+
+
+def _pack_bits(samples, num_bits):
+    """Convert computational basis samples from binary representation, with
+    the most significant bit first, to base 10 representation.
+
+    Args:
+        samples (array[int]): samples of basis states in binary representation,
+            of shape ``(shots, num_bits)``
+        num_bits (int): the number of bits of each sample
+
+    Returns:
+        array[int]: samples of basis states in base 10 representation
+    """
+    powers_of_two = _powers_of_two(num_bits)
+    # pack in the narrowest integer type that fits, so that ``uint8`` samples
+    # of up to eight wires are never upcast
+    return np.asarray(samples).astype(powers_of_two.dtype, copy=False) @ powers_of_two
+
+
+def _wires_mask(device_wires):
+    """Return a bitmask of wires in the device's internal labelling scheme.
+
+    Args:
+        device_wires (Iterable[int]): consecutive integer labels of device wires
+
+    Returns:
+        int: bitmask with bit ``i`` set for each wire ``i`` in ``device_wires``
+    """
+    mask = 0
+
+    for wire in device_wires:
+        mask |= 1 << wire
+
+    return mask
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_hist_from_bits():
+    """Return the Numba-compiled histogram used to estimate probabilities from samples.
+
+    Numba is an optional dependency. It is only imported the first time this function
+    is called. If Numba is not installed, or cannot cache the compiled function, the
+    NumPy implementation is used instead.
+
+    Returns:
+        callable or None: the compiled histogram ``hist_from_bits(bits, num_wires, shots)``
+        defined in :mod:`pennylane._numba_kernels`, or ``None`` if Numba is not available
+    """
+    # pylint: disable=import-outside-toplevel
+    try:
+        from pennylane._numba_kernels import hist_from_bits
+    except (ImportError, RuntimeError):
+        # Numba is not installed, or no writable cache location was found
+        return None
+
+    return hist_from_bits
+
+
+# minimum number of wires for which marginal probabilities are computed
+# by _fold_marginalize rather than a single multi-axis reduction
+_FOLD_MIN_WIRES = 18
+
+
+def _fold_marginalize(prob, num_wires, inactive_wires):
+    """Sum a probability over the inactive wires by successively folding
+    its axes.
+
+    Consecutive inactive wires are summed over together, starting from the least
+    significant wires, so that the indices of the remaining wires stay valid. A
+    single inactive wire is folded by adding the two halves of its axis. Each pass
+    streams through a working set half the size of the previous one, which is
+    considerably faster than a strided multi-axis reduction when active and inactive
+    wires are interleaved.
+
+    Args:
+        prob (array[float]): the probability of shape ``[2] * num_wires``
+        num_wires (int): the number of wires
+        inactive_wires (Iterable[int]): the axes to sum over
+
+    Returns:
+        array[float]: the marginal probability of shape ``[2] * k``, where ``k`` is
+        the number of remaining wires
+    """
+    inactive_wires = sorted(inactive_wires)
+
+    # group the inactive wires into runs of consecutive wires
+    runs = []
+    for wire in inactive_wires:
+        if runs and runs[-1][1] == wire:
+            runs[-1][1] += 1
+        else:
+            runs.append([wire, wire + 1])
+
+    for start, stop in reversed(runs):
+        prob = np.reshape(prob, [2 ** start, 2 ** (stop - start), -1])
+
+        if stop - start == 1:
+            prob = prob[:, 0] + prob[:, 1]
+        else:
+            prob = np.sum(prob, axis=1)
+
+    return np.reshape(prob, [2] * (num_wires - len(inactive_wires)))
+
 
 class QubitDevice(Device):
     """Abstract base class for PennyLane qubit devices.
@@ -71,15 +206,38 @@ class QubitDevice(Device):
             executions. A value of ``0`` indicates that no caching will take place. Once filled,
             older elements of the cache are removed and replaced with the most recent device
             executions to keep the cache up to date.
+        seed (None, int, array_like[int], SeedSequence, BitGenerator, Generator): A seed
+            used to initialize the ``numpy.random.Generator`` from which the samples are drawn.
+            If ``None``, fresh, unpredictable entropy is pulled from the operating system.
     """
 
     # pylint: disable=too-many-public-methods
+
+    # The attributes accessed on every execution are stored in slots. Since the
+    # Device base class does not define __slots__, instances keep a __dict__, and
+    # subclasses remain free to define additional attributes.
+    __slots__ = (
+        "analytic",
+        "_rng",
+        "_samples",
+        "_samples_col",
+        "_circuit_hash",
+        "_eigvals_cache",
+        "_analytic_prob_cache",
+        "_cache",
+        "_cache_execute",
+    )
+
     C_DTYPE = np.complex128
     R_DTYPE = np.float64
     _asarray = staticmethod(np.asarray)
     _dot = staticmethod(np.dot)
     _abs = staticmethod(np.abs)
-    _reduce_sum = staticmethod(lambda array, axes: np.sum(array, axis=tuple(axes)))
+    _reduce_sum = staticmethod(
+        lambda array, axes: _fold_marginalize(array, array.ndim, axes)
+        if array.ndim >= _FOLD_MIN_WIRES
+        else np.sum(array, axis=tuple(axes))
+    )
     _reshape = staticmethod(np.reshape)
     _flatten = staticmethod(lambda array: array.flatten())
     _gather = staticmethod(lambda array, indices: array[indices])
@@ -103,7 +261,7 @@ class QubitDevice(Device):
 
     observables = {"PauliX", "PauliY", "PauliZ", "Hadamard", "Hermitian", "Identity"}
 
-    def __init__(self, wires=1, shots=1000, analytic=True, cache=0):
+    def __init__(self, wires=1, shots=1000, analytic=True, cache=0, seed=None):
         super().__init__(wires=wires, shots=shots)
 
         self.analytic = analytic
@@ -111,14 +269,33 @@ class QubitDevice(Device):
         values, variances, and probabilities. If ``False``, samples are used
         to estimate the statistical quantities above."""
 
+        self._rng = np.random.default_rng(seed)
+        """numpy.random.Generator: the random number generator used to generate samples."""
+
         self._samples = None
         """None or array[int]: stores the samples generated by the device
         *after* rotation to diagonalize the observables."""
 
+        self._samples_col = None
+        """None or dict[Number or str, array[int]]: stores the computational basis samples
+        of individual wires, generated *after* rotation to diagonalize the observables,
+        when only single-qubit Pauli observables are estimated. See :meth:`~._fast_local_sample`."""
+
         self._circuit_hash = None
         """None or int: stores the hash of the circuit from the last execution which
         can be used by devices in :meth:`apply` for parametric compilation."""
 
+        self._eigvals_cache = {}
+        """dict[int, tuple[.Observable, list, array, None or array]]: Mapping from the ``id``
+        of an observable to the observable, its parameters, its eigenvalues and, once computed,
+        its squared eigenvalues. See :meth:`~._get_eigvals`."""
+
+        self._analytic_prob_cache = None
+        """None or dict[None or tuple, array[float]]: Mapping from the measured device wire
+        labels to the (marginal) analytic probability. The probability of all wires is stored
+        under the key ``None``. Only populated while computing the statistics in :meth:`execute`,
+        so that the full analytic probability is computed at most once per execution."""
+
         self._cache = cache
         """int: Number of device executions to store in a cache to speed up subsequent
         executions. If set to zero, no caching occurs."""
@@ -146,7 +323,9 @@ class QubitDevice(Device):
         Most importantly the quantum state is reset to its initial value.
         """
         self._samples = None
+        self._samples_col = None
         self._circuit_hash = None
+        self._analytic_prob_cache = None
 
     def execute(self, circuit, **kwargs):
         """Execute a queue of quantum operations on the device and then
@@ -186,21 +365,44 @@ class QubitDevice(Device):
 
         self._circuit_hash = circuit.hash
 
+        # discard the cached eigenvalues of observables not measured by this circuit
+        obs_ids = {id(obs) for obs in circuit.observables}
+        self._eigvals_cache = {
+            key: value for key, value in self._eigvals_cache.items() if key in obs_ids
+        }
+
         # apply all circuit operations
         self.apply(circuit.operations, rotations=circuit.diagonalizing_gates, **kwargs)
 
         # generate computational basis samples
         if (not self.analytic) or circuit.is_sampled:
-            self._samples = self.generate_samples()
-
-        # compute the required statistics
-        results = self.statistics(circuit.observables)
+            if self._supports_local_sampling(circuit.observables):
+                self._samples = None
+                self._samples_col = self._fast_local_sample(circuit.observables)
+            else:
+                self._samples_col = None
+                self._samples = self.generate_samples()
+
+        # compute the required statistics, sharing the analytic
+        # probability between all of the observables
+        self._analytic_prob_cache = {}
+
+        try:
+            results = self.statistics(circuit.observables)
+        finally:
+            self._analytic_prob_cache = None
 
         # Ensures that a combination with sample does not put
         # expvals and vars in superfluous arrays
         all_sampled = all(obs.return_type is Sample for obs in circuit.observables)
         if circuit.is_sampled and not all_sampled:
-            results = self._asarray(results, dtype="object")
+            # Assign each result to an object array with one entry per observable,
+            # rather than letting NumPy infer the shape of the (ragged) results. Otherwise,
+            # if all results happen to have the same length, every element of the samples
+            # is boxed into a separate Python object.
+            object_results = np.empty(len(results), dtype=object)
+            object_results[:] = results
+            results = object_results
         else:
             results = self._asarray(results)
 
@@ -228,6 +430,10 @@ class QubitDevice(Device):
 
         For plugin developers: This function should be overwritten if the device can efficiently run multiple
         circuits on a backend, for example using parallel and/or asynchronous executions.
+        Batches frequently contain circuits that share the same structure and differ only in
+        their parameters (for instance, the circuits generated by the parameter-shift rule);
+        simulators may exploit this by compiling the circuit once and evolving a stacked
+        ``(batch, 2 ** num_wires)`` state.
 
         Args:
             circuits (list[.tapes.QuantumTape]): circuits to execute on the device
@@ -306,6 +512,27 @@ class QubitDevice(Device):
 
         return Wires.all_wires(list_of_wires)
 
+    def active_wires_mask(self, operators):
+        """Returns the wires acted on by a set of operators as a bitmask.
+
+        Bit ``i`` of the bitmask is set if the operators act on the wire
+        with index ``i`` in the device's internal labelling scheme.
+
+        **Example**
+
+        >>> dev = qml.device("default.qubit", wires=["a", "b", "c"])
+        >>> dev.active_wires_mask([qml.CNOT(wires=["a", "c"])])
+        5
+
+        Args:
+            operators (list[~.Operation]): operators for which
+                we are gathering the active wires
+
+        Returns:
+            int: bitmask of the wires activated by the specified operators
+        """
+        return _wires_mask(wire for op in operators for wire in self.map_wires(op.wires).labels)
+
     def statistics(self, observables):
         """Process measurement results from circuit execution and return statistics.
 
@@ -321,43 +548,99 @@ class QubitDevice(Device):
         Returns:
             Union[float, List[float]]: the corresponding statistics
         """
-        results = []
-
-        for obs in observables:
-            # Pass instances directly
-            if obs.return_type is Expectation:
-                results.append(self.expval(obs))
-
-            elif obs.return_type is Variance:
-                results.append(self.var(obs))
-
-            elif obs.return_type is Sample:
-                results.append(np.array(self.sample(obs)))
-
-            elif obs.return_type is Probability:
-                results.append(self.probability(wires=obs.wires))
-
-            elif obs.return_type is State:
-                if len(observables) > 1:
-                    raise QuantumFunctionError(
-                        "The state or density matrix cannot be returned in combination"
-                        " with other return types"
-                    )
-                if self.wires.labels != tuple(range(self.num_wires)):
-                    raise QuantumFunctionError(
-                        "Returning the state is not supported when using custom wire labels"
-                    )
-                # Check if the state is accessible and decide to return the state or the density
-                # matrix.
-                results.append(self.access_state(wires=obs.wires))
-
-            elif obs.return_type is not None:
+        handlers = {
+            Expectation: self._expvals,
+            Variance: lambda obs_list: [self.var(obs) for obs in obs_list],
+            Sample: lambda obs_list: [np.array(self.sample(obs)) for obs in obs_list],
+            Probability: lambda obs_list: [self.probability(wires=obs.wires) for obs in obs_list],
+            State: lambda obs_list: [
+                self._state_or_density_matrix(obs, len(observables)) for obs in obs_list
+            ],
+        }
+
+        # group the positions of the observables by their return type
+        groups = OrderedDict()
+
+        for idx, obs in enumerate(observables):
+            if obs.return_type is None:
+                continue
+
+            if obs.return_type not in handlers:
                 raise QuantumFunctionError(
                     "Unsupported return type specified for observable {}".format(obs.name)
                 )
 
+            groups.setdefault(obs.return_type, []).append(idx)
+
+        results = {}
+
+        for return_type, indices in groups.items():
+            values = handlers[return_type]([observables[idx] for idx in indices])
+            results.update(zip(indices, values))
+
+        return [results[idx] for idx in sorted(results)]
+
+    def _expvals(self, observables):
+        """Return the expectation values of several observables.
+
+        If the expectation values are computed analytically by :meth:`expval`, those of
+        single-qubit Pauli observables are evaluated together as the differences
+        :math:`p_0 - p_1` of their stacked marginal probabilities. All other expectation
+        values are computed by :meth:`expval`.
+
+        Args:
+            observables (List[.Observable]): observables with return type ``Expectation``
+
+        Returns:
+            List[float]: the expectation values of the observables
+        """
+        if not self.analytic or type(self).expval is not QubitDevice.expval:
+            # the device estimates, or provides its own, expectation values
+            return [self.expval(obs) for obs in observables]
+
+        paulis = [idx for idx, obs in enumerate(observables) if self._is_pauli(obs)]
+
+        if len(paulis) < 2:
+            return [self.expval(obs) for obs in observables]
+
+        results = [None if self._is_pauli(obs) else self.expval(obs) for obs in observables]
+
+        prob = self._stack([self.probability(wires=observables[idx].wires) for idx in paulis])
+        expvals = prob[:, 0] - prob[:, 1]
+
+        for i, idx in enumerate(paulis):
+            results[idx] = expvals[i]
+
         return results
 
+    def _state_or_density_matrix(self, observable, num_observables):
+        """Return the state or density matrix of the device, as requested by an
+        observable with return type ``State``.
+
+        Args:
+            observable (.Observable): the observable
+            num_observables (int): the number of observables measured by the circuit
+
+        Raises:
+            QuantumFunctionError: if the state is measured in combination with other
+                observables, or the device uses custom wire labels
+
+        Returns:
+            array[complex]: the state or density matrix
+        """
+        if num_observables > 1:
+            raise QuantumFunctionError(
+                "The state or density matrix cannot be returned in combination"
+                " with other return types"
+            )
+        if self.wires.labels != tuple(range(self.num_wires)):
+            raise QuantumFunctionError(
+                "Returning the state is not supported when using custom wire labels"
+            )
+        # Check if the state is accessible and decide to return the state or the density
+        # matrix.
+        return self.access_state(wires=observable.wires)
+
     def access_state(self, wires=None):
         """Check that the device has access to an internal state and return it if available.
 
@@ -406,20 +689,109 @@ class QubitDevice(Device):
         samples = self.sample_basis_states(number_of_states, rotated_prob)
         return QubitDevice.states_to_binary(samples, self.num_wires)
 
+    def _supports_local_sampling(self, observables):
+        """Determine whether the samples required to estimate the statistics of
+        the given observables can be generated independently for each wire.
+
+        This is the case if the device generates its samples from
+        :meth:`~.analytic_probability` (i.e., :meth:`~.generate_samples` is not overwritten),
+        and only the expectation values and variances of single-qubit observables
+        with eigenvalues :math:`\\pm 1` are requested. Correlations between the wires
+        do not affect any of these statistics.
+
+        Since computing the marginal probabilities requires a pass over all :math:`2^N`
+        basis state probabilities, local sampling is only used if the number of sampled
+        bits, ``shots * num_wires``, exceeds the number of basis states.
+
+        Args:
+            observables (List[.Observable]): the observables to be measured
+
+        Returns:
+            bool: whether :meth:`~._fast_local_sample` may be used
+        """
+        if type(self).generate_samples is not QubitDevice.generate_samples:
+            return False
+
+        if self.shots * self.num_wires <= 2 ** self.num_wires:
+            return False
+
+        return bool(observables) and all(
+            obs.return_type in (Expectation, Variance) and self._is_pauli(obs)
+            for obs in observables
+        )
+
+    def _fast_local_sample(self, observables):
+        """Generate computational basis samples independently for each wire
+        measured by the given single-qubit observables.
+
+        Rather than sampling from the probability distribution over all
+        :math:`2^N` basis states, the samples of each wire are drawn directly
+        from its marginal probability distribution. The marginal probabilities
+        of all wires are computed in a single pass over the :math:`2^N` probabilities.
+
+        Args:
+            observables (List[.Observable]): single-qubit observables to be measured
+
+        Returns:
+            dict[Number or str, array[int]]: mapping from the device wire labels
+            to the samples of that wire, each of length ``dev.shots``
+        """
+        # look up the single wires directly, avoiding the creation of a new Wires object per call
+        device_wires = sorted({self.wire_map[obs.wires].labels[0] for obs in observables})
+
+        # compute the probability of measuring 1 on every wire from the last one to the
+        # first measured wire in a single pass, marginalizing out one wire per step
+        prob = np.asarray(self.analytic_probability())
+        p1 = np.zeros(self.num_wires)
+
+        for wire in range(self.num_wires - 1, device_wires[0] - 1, -1):
+            prob = np.reshape(prob, [-1, 2])
+            p1[wire] = prob[:, 1].sum()
+            prob = prob[:, 0] + prob[:, 1]
+
+        samples = self._rng.random((len(device_wires), self.shots)) < p1[device_wires, np.newaxis]
+        return dict(zip(device_wires, samples.view(np.uint8)))
+
     def sample_basis_states(self, number_of_states, state_probability):
         """Sample from the computational basis states based on the state
         probability.
 
         This is an auxiliary method to the generate_samples method.
 
+        Samples are drawn by inverse transform sampling; uniformly distributed
+        random numbers are located in the cumulative distribution function
+        of the state probability using a binary search.
+
         Args:
             number_of_states (int): the number of basis states to sample from
+            state_probability (array[float]): the probability of each basis state
 
         Returns:
             List[int]: the sampled basis states
+
+        Raises:
+            ValueError: if the state probability is negative or does not sum to one
         """
-        basis_states = np.arange(number_of_states)
-        return np.random.choice(basis_states, self.shots, p=state_probability)
+        state_probability = np.reshape(state_probability, [number_of_states])
+
+        # validate the state probability with the same tolerance as ``np.random.choice``
+        atol = np.sqrt(np.finfo(np.float64).eps)
+        if np.issubdtype(state_probability.dtype, np.floating):
+            atol = max(atol, np.sqrt(np.finfo(state_probability.dtype).eps))
+
+        if np.any(state_probability < 0):
+            raise ValueError("Probabilities are not non-negative.")
+
+        cdf = np.cumsum(state_probability, dtype=np.float64)
+
+        if abs(cdf[-1] - 1) > atol:
+            raise ValueError("Probabilities do not sum to 1.")
+
+        # normalize to remove floating point round-off, without assigning
+        # probability to the last basis states if they have none
+        cdf /= cdf[-1]
+
+        return np.searchsorted(cdf, self._rng.random(self.shots), side="right")
 
     @staticmethod
     def generate_basis_states(num_wires, dtype=np.uint32):
@@ -459,24 +831,38 @@ class QubitDevice(Device):
         )
 
     @staticmethod
-    def states_to_binary(samples, num_wires, dtype=np.int64):
+    def states_to_binary(samples, num_wires, dtype=np.uint8):
         """Convert basis states from base 10 to binary representation.
 
         This is an auxiliary method to the generate_samples method.
 
+        The conversion views each sample as 8 little-endian bytes and
+        unpacks them with ``np.unpackbits``, avoiding the creation of an
+        intermediate ``(len(samples), num_wires)`` integer bitmask array.
+
         Args:
             samples (List[int]): samples of basis states in base 10 representation
             num_wires (int): the number of qubits
-            dtype (type): Type of the internal integer array to be used. Can be
+            dtype (type): Type of the returned integer array. Can be
                 important to specify for large systems for memory allocation
                 purposes.
 
         Returns:
             List[int]: basis states in binary representation
         """
-        powers_of_two = 1 << np.arange(num_wires, dtype=dtype)
-        states_sampled_base_ten = samples[:, None] & powers_of_two
-        return (states_sampled_base_ten > 0).astype(dtype)[:, ::-1]
+        samples = np.ascontiguousarray(samples, dtype="<u8")
+
+        # only unpack the lowest ``num_wires`` bits of the bytes that contain them
+        num_bytes = (num_wires + 7) // 8
+        bits = np.unpackbits(
+            samples.view(np.uint8).reshape(-1, 8)[:, :num_bytes],
+            axis=1,
+            count=num_wires,
+            bitorder="little",
+        )
+
+        # return a contiguous copy, with the most significant bit first
+        return np.ascontiguousarray(bits[:, ::-1], dtype=dtype)
 
     @property
     def circuit_hash(self):
@@ -552,14 +938,22 @@ class QubitDevice(Device):
 
         samples = self._samples[:, device_wires]
 
-        # convert samples from a list of 0, 1 integers, to base 10 representation
-        unraveled_indices = [2] * len(device_wires)
-        indices = np.ravel_multi_index(samples.T, unraveled_indices)
+        hist_from_bits = None
+
+        if len(samples) > max(_NUMBA_MIN_SHOTS, 2 ** len(device_wires)):
+            hist_from_bits = _numba_hist_from_bits()
+
+        if hist_from_bits is not None:
+            # count the basis state occurrences directly from the binary samples
+            counts = hist_from_bits(samples, len(device_wires), len(samples))
+        else:
+            # convert samples from a list of 0, 1 integers, to base 10 representation
+            indices = _pack_bits(samples, len(device_wires))
+
+            # count the basis state occurrences
+            counts = np.bincount(indices, minlength=2 ** len(device_wires))
 
-        # count the basis state occurrences, and construct the probability vector
-        basis_states, counts = np.unique(indices, return_counts=True)
-        prob = np.zeros([2 ** len(device_wires)], dtype=np.float64)
-        prob[basis_states] = counts / len(samples)
+        prob = counts / len(samples)
         return self._asarray(prob, dtype=self.R_DTYPE)
 
     def probability(self, wires=None):
@@ -578,10 +972,38 @@ class QubitDevice(Device):
         """
 
         if hasattr(self, "analytic") and self.analytic:
-            return self.analytic_probability(wires=wires)
+            if self._analytic_prob_cache is None:
+                return self.analytic_probability(wires=wires)
+
+            return self._cached_analytic_probability(wires=wires)
 
         return self.estimate_probability(wires=wires)
 
+    def _cached_analytic_probability(self, wires=None):
+        """Return the analytic probability of each computational basis state, marginalized
+        from the probability of all wires stored in :attr:`~._analytic_prob_cache`.
+
+        Args:
+            wires (Iterable[Number, str], Number, str, Wires): wires to return
+                marginal probabilities for. Wires not provided are traced out of the system.
+
+        Returns:
+            List[float]: list of the probabilities
+        """
+        cache = self._analytic_prob_cache
+        key = None if wires is None else self.map_wires(Wires(wires)).labels
+
+        if key not in cache:
+            if None not in cache:
+                cache[None] = self.analytic_probability()
+
+            if cache[None] is None or key is None:
+                return cache[None]
+
+            cache[key] = self.marginal_prob(cache[None], wires)
+
+        return cache[key]
+
     def marginal_prob(self, prob, wires=None):
         r"""Return the marginal probability of the computational basis
         states by summing the probabiliites on the non-specified wires.
@@ -622,34 +1044,91 @@ class QubitDevice(Device):
             return prob
 
         wires = Wires(wires)
-        # determine which subsystems are to be summed over
-        inactive_wires = Wires.unique_wires([self.wires, wires])
 
         # translate to wire labels used by device
         device_wires = self.map_wires(wires)
-        inactive_device_wires = self.map_wires(inactive_wires)
+
+        # determine which subsystems are to be summed over
+        mask = _wires_mask(device_wires.labels)
+        inactive_device_wires = tuple(i for i in range(self.num_wires) if not mask >> i & 1)
 
         # reshape the probability so that each axis corresponds to a wire
         prob = self._reshape(prob, [2] * self.num_wires)
 
         # sum over all inactive wires
-        prob = self._flatten(self._reduce_sum(prob, inactive_device_wires.labels))
+        prob = self._reduce_sum(prob, inactive_device_wires)
 
         # The wires provided might not be in consecutive order (i.e., wires might be [2, 0]).
-        # If this is the case, we must permute the marginalized probability so that
-        # it corresponds to the orders of the wires passed.
-        num_wires = len(device_wires)
-        basis_states = self.generate_basis_states(num_wires)
-        perm = np.ravel_multi_index(
-            basis_states[:, np.argsort(np.argsort(device_wires))].T, [2] * len(device_wires)
-        )
-        return self._gather(prob, perm)
+        # If this is the case, we must permute the axes of the marginalized probability so that
+        # they correspond to the order of the wires passed.
+        perm = np.argsort(np.argsort(device_wires.labels))
+        return self._flatten(self._transpose(prob, perm))
+
+    def _get_eigvals(self, observable, squared=False):
+        """Return the eigenvalues of an observable.
+
+        The eigenvalues are cached, and reused by subsequent executions of circuits measuring
+        the same observable object as long as its parameters are unchanged, such as repeated
+        executions of the same tape, or the shifted tapes of the parameter-shift rule. This
+        avoids re-evaluating :attr:`~.Observable.eigvals` for every execution, which for
+        :class:`~.Hermitian` observables rebuilds and validates the matrix before looking up
+        its eigendecomposition, and allows the squared eigenvalues used by :meth:`var` to be
+        cached alongside the eigenvalues.
+
+        Args:
+            observable (.Observable): the observable
+            squared (bool): If ``True``, return the squared eigenvalues, as required
+                to compute the variance. These are cached alongside the eigenvalues.
+
+        Returns:
+            array: the (squared) eigenvalues of the observable
+        """
+        params = list(observable.data)
+
+        if any(isinstance(p, Variable) or getattr(p, "dtype", None) == object for p in params):
+            # the parameter values depend on the arguments of the QNode
+            eigvals = observable.eigvals
+            return eigvals ** 2 if squared else eigvals
+
+        key = id(observable)
+        cached = self._eigvals_cache.get(key)
+
+        # The cache stores a reference to the observable, ensuring that its ``id``
+        # is not reused by another object while the entry exists.
+        if (
+            cached is None
+            or len(cached[1]) != len(params)
+            or not all(p is q for p, q in zip(cached[1], params))
+        ):
+            cached = (observable, params, observable.eigvals, None)
+            self._eigvals_cache[key] = cached
+
+        if not squared:
+            return cached[2]
+
+        if cached[3] is None:
+            cached = cached[:3] + (cached[2] ** 2,)
+            self._eigvals_cache[key] = cached
+
+        return cached[3]
+
+    @staticmethod
+    def _is_pauli(observable):
+        """Whether the observable is a single-qubit observable with eigenvalues
+        :math:`\\pm 1`, such that :math:`\\langle P \\rangle = p_0 - p_1`."""
+        name = observable.name
+        return isinstance(name, str) and name in _PAULI_OBSERVABLES and len(observable.wires) == 1
 
     def expval(self, observable):
 
         if self.analytic:
+            if self._is_pauli(observable):
+                # the eigenvalues are [1, -1]
+                prob = self.probability(wires=observable.wires)
+                return prob[0] - prob[1]
+
             # exact expectation value
-            eigvals = self._asarray(observable.eigvals, dtype=self.R_DTYPE)
+            eigvals = self._asarray(self._get_eigvals(observable), dtype=self.R_DTYPE)
             prob = self.probability(wires=observable.wires)
             return self._dot(eigvals, prob)
 
@@ -659,10 +1138,18 @@ class QubitDevice(Device):
     def var(self, observable):
 
         if self.analytic:
+            if self._is_pauli(observable):
+                # the eigenvalues are [1, -1], and therefore square to one
+                prob = self.probability(wires=observable.wires)
+                return 1 - (prob[0] - prob[1]) ** 2
+
             # exact variance value
-            eigvals = self._asarray(observable.eigvals, dtype=self.R_DTYPE)
+            eigvals = self._asarray(self._get_eigvals(observable), dtype=self.R_DTYPE)
+            eigvals_sq = self._asarray(
+                self._get_eigvals(observable, squared=True), dtype=self.R_DTYPE
+            )
             prob = self.probability(wires=observable.wires)
-            return self._dot((eigvals ** 2), prob) - self._dot(eigvals, prob) ** 2
+            return self._dot(eigvals_sq, prob) - self._dot(eigvals, prob) ** 2
 
         # estimate the variance
         return np.var(self.sample(observable))
@@ -673,13 +1160,19 @@ class QubitDevice(Device):
         device_wires = self.map_wires(observable.wires)
         name = observable.name
 
-        if isinstance(name, str) and name in {"PauliX", "PauliY", "PauliZ", "Hadamard"}:
+        if isinstance(name, str) and name in _PAULI_OBSERVABLES:
             # Process samples for observables with eigenvalues {1, -1}
-            return 1 - 2 * self._samples[:, device_wires.labels[0]]
+            if self._samples is None and self._samples_col is not None:
+                # samples were generated independently for each wire
+                samples = self._samples_col[device_wires.labels[0]]
+            else:
+                samples = self._samples[:, device_wires.labels[0]]
+
+            # cast to a signed integer to avoid wrap-around of unsigned samples
+            return 1 - 2 * samples.astype(np.int64)
 
         # Replace the basis state in the computational basis with the correct eigenvalue.
         # Extract only the columns of the basis samples required based on ``wires``.
         samples = self._samples[:, device_wires]
-        unraveled_indices = [2] * len(device_wires)
-        indices = np.ravel_multi_index(samples.T, unraveled_indices)
-        return observable.eigvals[indices]
+        indices = _pack_bits(samples, len(device_wires))
+        return self._get_eigvals(observable)[indices]
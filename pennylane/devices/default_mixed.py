@@ -50,6 +50,9 @@ class DefaultMixed(QubitDevice):
             executions. A value of ``0`` indicates that no caching will take place. Once filled,
             older elements of the cache are removed and replaced with the most recent device
             executions to keep the cache up to date.
+        seed (None, int, array_like[int], SeedSequence, BitGenerator, Generator): A seed
+            used to initialize the ``numpy.random.Generator`` from which the samples are drawn.
+            If ``None``, fresh, unpredictable entropy is pulled from the operating system.
     """
 
     name = "Default mixed-state qubit PennyLane plugin"
@@ -92,13 +95,13 @@ class DefaultMixed(QubitDevice):
         "QubitChannel",
     }
 
-    def __init__(self, wires, *, shots=1000, analytic=True, cache=0):
+    def __init__(self, wires, *, shots=1000, analytic=True, cache=0, seed=None):
         if isinstance(wires, int) and wires > 23:
             raise ValueError(
                 "This device does not currently support computations on more than 23 wires"
             )
         # call QubitDevice init
-        super().__init__(wires, shots, analytic, cache=cache)
+        super().__init__(wires, shots, analytic, cache=cache, seed=seed)
 
         # Create the initial state.
         self._state = self._create_basis_state(0)
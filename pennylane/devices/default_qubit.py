@@ -83,6 +83,9 @@ class DefaultQubit(QubitDevice):
             executions. A value of ``0`` indicates that no caching will take place. Once filled,
             older elements of the cache are removed and replaced with the most recent device
             executions to keep the cache up to date.
+        seed (None, int, array_like[int], SeedSequence, BitGenerator, Generator): A seed
+            used to initialize the ``numpy.random.Generator`` from which the samples are drawn.
+            If ``None``, fresh, unpredictable entropy is pulled from the operating system.
     """
 
     name = "Default qubit PennyLane plugin"
@@ -123,9 +126,9 @@ class DefaultQubit(QubitDevice):
 
     observables = {"PauliX", "PauliY", "PauliZ", "Hadamard", "Hermitian", "Identity"}
 
-    def __init__(self, wires, *, shots=1000, analytic=True, cache=0):
+    def __init__(self, wires, *, shots=1000, analytic=True, cache=0, seed=None):
         # call QubitDevice init
-        super().__init__(wires, shots, analytic, cache=cache)
+        super().__init__(wires, shots, analytic, cache=cache, seed=seed)
 
         # Create the initial state. Internally, we store the
         # state as an array of dimension [2]*wires.
@@ -78,6 +78,9 @@ class DefaultQubitAutograd(DefaultQubit):
             and variances analytically. In non-analytic mode, the ``diff_method="backprop"``
             QNode differentiation method is not supported and it is recommended to consider
             switching device to ``default.qubit`` and using ``diff_method="parameter-shift"``.
+        seed (None, int, array_like[int], SeedSequence, BitGenerator, Generator): A seed
+            used to initialize the ``numpy.random.Generator`` from which the samples are drawn.
+            If ``None``, fresh, unpredictable entropy is pulled from the operating system.
     """
 
     name = "Default qubit (Autograd) PennyLane plugin"
@@ -113,8 +116,8 @@ class DefaultQubitAutograd(DefaultQubit):
     _roll = staticmethod(np.roll)
     _stack = staticmethod(np.stack)
 
-    def __init__(self, wires, *, shots=1000, analytic=True):
-        super().__init__(wires, shots=shots, analytic=analytic, cache=0)
+    def __init__(self, wires, *, shots=1000, analytic=True, seed=None):
+        super().__init__(wires, shots=shots, analytic=analytic, cache=0, seed=seed)
 
         # prevent using special apply methods for these gates due to slowdown in Autograd
         # implementation
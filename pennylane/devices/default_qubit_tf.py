@@ -124,6 +124,9 @@ class DefaultQubitTF(DefaultQubit):
             and variances analytically. In non-analytic mode, the ``diff_method="backprop"``
             QNode differentiation method is not supported and it is recommended to consider
             switching device to ``default.qubit`` and using ``diff_method="parameter-shift"``.
+        seed (None, int, array_like[int], SeedSequence, BitGenerator, Generator): A seed
+            used to initialize the ``numpy.random.Generator`` from which the samples are drawn.
+            If ``None``, fresh, unpredictable entropy is pulled from the operating system.
     """
 
     name = "Default qubit (TensorFlow) PennyLane plugin"
@@ -160,8 +163,8 @@ class DefaultQubitTF(DefaultQubit):
     _roll = staticmethod(tf.roll)
     _stack = staticmethod(tf.stack)
 
-    def __init__(self, wires, *, shots=1000, analytic=True):
-        super().__init__(wires, shots=shots, analytic=analytic, cache=0)
+    def __init__(self, wires, *, shots=1000, analytic=True, seed=None):
+        super().__init__(wires, shots=shots, analytic=analytic, cache=0, seed=seed)
 
         # prevent using special apply method for this gate due to slowdown in TF implementation
         del self._apply_ops["CZ"]
@@ -665,6 +665,20 @@ class TestSample:
         # they square to 1
         assert np.allclose(s1**2, 1, atol=tol, rtol=0)
 
+    def test_seeded_samples(self):
+        """Tests that devices created with the same seed return the same samples"""
+
+        def circuit(dev):
+            dev.reset()
+            dev.apply([qml.RX(1.5708, wires=[0]), qml.RY(0.543, wires=[1])])
+            dev._samples = dev.generate_samples()
+            return dev.sample(qml.PauliZ(0) @ qml.PauliZ(1))
+
+        dev1 = qml.device("default.qubit", wires=2, shots=100, seed=42)
+        dev2 = qml.device("default.qubit", wires=2, shots=100, seed=42)
+
+        assert np.array_equal(circuit(dev1), circuit(dev2))
+
 
 class TestDefaultQubitIntegration:
     """Integration tests for default.qubit. This test ensures it integrates
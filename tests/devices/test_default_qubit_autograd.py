@@ -51,6 +51,22 @@ class TestQNodeIntegration:
         assert dev.short_name == "default.qubit.autograd"
         assert dev.capabilities()["passthru_interface"] == "autograd"
 
+    def test_seeded_samples(self):
+        """Test that devices created with the same seed return the same samples"""
+
+        def sample_circuit(dev):
+            @qml.qnode(dev, interface="autograd")
+            def circuit():
+                qml.Hadamard(wires=0)
+                return qml.sample(qml.PauliZ(0))
+
+            return circuit()
+
+        dev1 = qml.device("default.qubit.autograd", wires=1, shots=100, analytic=False, seed=42)
+        dev2 = qml.device("default.qubit.autograd", wires=1, shots=100, analytic=False, seed=42)
+
+        assert np.array_equal(sample_circuit(dev1), sample_circuit(dev2))
+
     def test_qubit_circuit(self, tol):
         """Test that the device provides the correct
         result for a simple circuit."""
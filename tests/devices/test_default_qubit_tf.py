@@ -887,6 +887,22 @@ class TestQNodeIntegration:
         assert dev.short_name == "default.qubit.tf"
         assert dev.capabilities()["passthru_interface"] == "tf"
 
+    def test_seeded_samples(self):
+        """Test that devices created with the same seed return the same samples"""
+
+        def sample_circuit(dev):
+            @qml.qnode(dev, interface="tf")
+            def circuit():
+                qml.Hadamard(wires=0)
+                return qml.sample(qml.PauliZ(0))
+
+            return circuit()
+
+        dev1 = qml.device("default.qubit.tf", wires=1, shots=100, analytic=False, seed=42)
+        dev2 = qml.device("default.qubit.tf", wires=1, shots=100, analytic=False, seed=42)
+
+        assert np.array_equal(sample_circuit(dev1), sample_circuit(dev2))
+
     def test_qubit_circuit(self, tol):
         """Test that the tensor network plugin provides correct
         result for a simple circuit using the old QNode."""
@@ -216,6 +216,24 @@ class TestSample:
         assert result[2].dtype == np.dtype("int")
         assert np.array_equal(result[2].shape, (n_sample,))
 
+    def test_sample_output_type_in_combination_equal_lengths(self, tol):
+        """Test that the samples are not split into separate objects when
+        combined with a probability of the same length"""
+        dev = qml.device("default.qubit", wires=2, shots=2)
+
+        @qml.qnode(dev)
+        def circuit():
+            qml.Hadamard(wires=0)
+            return qml.sample(qml.PauliZ(0)), qml.probs(wires=[1])
+
+        result = circuit()
+
+        assert isinstance(result, np.ndarray)
+        assert result.dtype == np.dtype("object")
+        assert np.array_equal(result.shape, (2,))
+        assert result[0].dtype == np.dtype("int")
+        assert np.allclose(result[1], [1, 0], atol=tol, rtol=0)
+
     def test_not_an_observable(self):
         """Test that a QuantumFunctionError is raised if the provided
         argument is not an observable"""
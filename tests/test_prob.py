@@ -67,8 +67,8 @@ def test_marginal_prob(init_state, tol):
     assert np.allclose(res, expected, atol=tol, rtol=0)
 
 def test_marginal_prob_more_wires(init_state, mocker, tol):
-    """Test that the correct marginal probability is returned, when the
-    states_to_binary method is used for probability computations."""
+    """Test that the correct marginal probability is returned for more than two
+    permuted wires, without generating the basis states."""
     dev = qml.device("default.qubit", wires=4)
     state = init_state(4)
 
@@ -77,7 +77,7 @@ def test_marginal_prob_more_wires(init_state, mocker, tol):
     @qml.qnode(dev)
     def circuit():
         qml.QubitStateVector(state, wires=list(range(4)))
-        return qml.probs(wires=[1, 0, 3])    # <--- more than 2 wires: states_to_binary used
+        return qml.probs(wires=[1, 0, 3])
 
     res = circuit()
 
@@ -85,7 +85,25 @@ def test_marginal_prob_more_wires(init_state, mocker, tol):
     expected = np.einsum("ijkl->jil", expected).flatten()
     assert np.allclose(res, expected, atol=tol, rtol=0)
 
-    spy.assert_called_once()
+    spy.assert_not_called()
+
+@pytest.mark.parametrize("wires,subscripts", [([2, 0, 1], "ijk->kij"), ([1, 2, 0], "ijk->jki")])
+def test_marginal_prob_cyclic_wires(init_state, wires, subscripts, tol):
+    """Test that the correct marginal probability is returned for wire orders
+    that are not their own inverse permutation."""
+    dev = qml.device("default.qubit", wires=3)
+    state = init_state(3)
+
+    @qml.qnode(dev)
+    def circuit():
+        qml.QubitStateVector(state, wires=list(range(3)))
+        return qml.probs(wires=wires)
+
+    res = circuit()
+
+    expected = np.reshape(np.abs(state)**2, [2]*3)
+    expected = np.einsum(subscripts, expected).flatten()
+    assert np.allclose(res, expected, atol=tol, rtol=0)
 
 def test_integration(tol):
     """Test the probability is correct for a known state preparation."""
@@ -14,12 +14,16 @@
 """
 Unit tests for the :mod:`pennylane` :class:`QubitDevice` class.
 """
+import subprocess
+import sys
+
 import pytest
 import numpy as np
 from random import random
 
 import pennylane as qml
 from pennylane import QubitDevice, DeviceError
+from pennylane._qubit_device import _pack_bits, _powers_of_two, _fold_marginalize
 from pennylane.qnodes import QuantumFunctionError
 from pennylane.qnodes.base import BaseQNode
 from pennylane.operation import Sample, Variance, Expectation, Probability, State
@@ -45,6 +49,7 @@ def mock_qubit_device(monkeypatch):
         m.setattr(QubitDevice, "observables", ["PauliZ"])
         m.setattr(QubitDevice, "short_name", "MockDevice")
         m.setattr(QubitDevice, "expval", lambda self, x: 0)
+        m.setattr(QubitDevice, "_expvals", lambda self, x: [0] * len(x))
         m.setattr(QubitDevice, "var", lambda self, x: 0)
         m.setattr(QubitDevice, "sample", lambda self, x: 0)
         m.setattr(QubitDevice, "apply", lambda self, x: None)
@@ -66,6 +71,7 @@ def mock_qubit_device_extract_stats(monkeypatch):
         m.setattr(QubitDevice, "observables", ["PauliZ"])
         m.setattr(QubitDevice, "short_name", "MockDevice")
         m.setattr(QubitDevice, "expval", lambda self, x: 0)
+        m.setattr(QubitDevice, "_expvals", lambda self, x: [0] * len(x))
         m.setattr(QubitDevice, "var", lambda self, x: 0)
         m.setattr(QubitDevice, "sample", lambda self, x: 0)
         m.setattr(QubitDevice, "state", 0)
@@ -115,6 +121,7 @@ def mock_qubit_device_with_paulis_and_methods(monkeypatch):
         m.setattr(QubitDevice, "observables", mock_qubit_device_paulis)
         m.setattr(QubitDevice, "short_name", "MockDevice")
         m.setattr(QubitDevice, "expval", lambda self, x: 0)
+        m.setattr(QubitDevice, "_expvals", lambda self, x: [0] * len(x))
         m.setattr(QubitDevice, "var", lambda self, x: 0)
         m.setattr(QubitDevice, "sample", lambda self, x: 0)
         m.setattr(QubitDevice, "apply", lambda self, x, rotations: None)
@@ -135,6 +142,7 @@ def mock_qubit_device_with_paulis_rotations_and_methods(monkeypatch):
         m.setattr(QubitDevice, "observables", mock_qubit_device_paulis)
         m.setattr(QubitDevice, "short_name", "MockDevice")
         m.setattr(QubitDevice, "expval", lambda self, x: 0)
+        m.setattr(QubitDevice, "_expvals", lambda self, x: [0] * len(x))
         m.setattr(QubitDevice, "var", lambda self, x: 0)
         m.setattr(QubitDevice, "sample", lambda self, x: 0)
         m.setattr(QubitDevice, "apply", lambda self, x: None)
@@ -173,7 +181,7 @@ class TestOperations:
         with monkeypatch.context() as m:
             m.setattr(QubitDevice, "apply",
                       lambda self, x, **kwargs: call_history.extend(x + kwargs.get('rotations', [])))
-            m.setattr(QubitDevice, "analytic_probability", lambda *args: None)
+            m.setattr(QubitDevice, "analytic_probability", lambda *args: np.array([0.5, 0.5]))
             dev = mock_qubit_device_with_paulis_and_methods()
             dev.execute(circuit_graph)
 
@@ -296,6 +304,21 @@ class TestObservables:
                 dev.execute(circuit_graph)
 
 
+class TestSlots:
+    """Test the slotted attributes of QubitDevice"""
+
+    def test_slotted_attributes(self, mock_qubit_device):
+        """Tests that the attributes listed in __slots__ are not stored in the
+        instance dictionary, while other attributes still can be"""
+        dev = mock_qubit_device()
+
+        assert dev._samples is None
+        assert not set(QubitDevice.__slots__) & set(vars(dev))
+
+        dev.custom_attribute = 1
+        assert vars(dev)["custom_attribute"] == 1
+
+
 class TestParameters:
     """Test for checking device parameter mappings"""
 
@@ -376,6 +399,58 @@ class TestExtractStatistics:
             dev = mock_qubit_device_extract_stats()
             dev.statistics([obs])
 
+    def test_results_in_order(self):
+        """Tests that the statistics of observables with different return types are
+        returned in the order the observables were measured"""
+        dev = qml.device("default.qubit", wires=2)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.4, wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.PauliZ(0))
+            qml.var(qml.PauliZ(1))
+            qml.expval(qml.Hermitian(np.diag([1, 3]), wires=1))
+            qml.expval(qml.PauliZ(1))
+
+        res = dev.execute(tape)
+        expected = [np.cos(0.4), np.sin(0.4) ** 2, 2 - np.cos(0.4), np.cos(0.4)]
+        assert np.allclose(res, expected)
+
+    def test_pauli_expvals_computed_together(self, mocker):
+        """Tests that the analytic expectation values of several Pauli observables
+        are computed from their stacked marginal probabilities"""
+        dev = qml.device("default.qubit", wires=3)
+        spy = mocker.spy(dev, "expval")
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.4, wires=0)
+            qml.RY(0.7, wires=2)
+            qml.expval(qml.PauliZ(0))
+            qml.expval(qml.PauliX(1))
+            qml.expval(qml.Hermitian(np.diag([1, 3]), wires=2))
+            qml.expval(qml.PauliZ(2))
+
+        res = dev.execute(tape)
+
+        assert np.allclose(res, [np.cos(0.4), 0, 2 - np.cos(0.7), np.cos(0.7)])
+        assert spy.call_count == 1
+
+    def test_overridden_expval_used(self):
+        """Tests that the expectation values of Pauli observables are computed by
+        expval if a subclass overrides it"""
+
+        class DeviceWithExpval(qml.devices.DefaultQubit):
+            def expval(self, observable):
+                return 2.0
+
+        dev = DeviceWithExpval(wires=2)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.expval(qml.PauliZ(0))
+            qml.expval(qml.PauliZ(1))
+
+        assert np.allclose(dev.execute(tape), [2, 2])
+
 
 class TestGenerateSamples:
     """Test the generate_samples method"""
@@ -400,23 +475,99 @@ class TestSampleBasisStates:
     """Test the sample_basis_states method"""
 
     def test_sampling_with_correct_arguments(self, mock_qubit_device, monkeypatch):
-        """Tests that the sample_basis_states method samples with the correct arguments"""
+        """Tests that the sample_basis_states method locates the drawn random numbers
+        in the cumulative distribution of the state probability"""
 
-        shots = 1000
+        shots = 5
 
         number_of_states = 4
         dev = mock_qubit_device()
         dev.shots = shots
         state_probs = [0.1, 0.2, 0.3, 0.4]
 
+        class MockGenerator:
+            """Mock random number generator returning the expected values"""
+
+            @staticmethod
+            def random(size):
+                return np.array([0.0, 0.15, 0.25, 0.7, 0.99])
+
         with monkeypatch.context() as m:
-            # Mock the numpy.random.choice method such that it returns the expected values
-            m.setattr("numpy.random.choice", lambda x, y, p: (x, y, p))
+            m.setattr(dev, "_rng", MockGenerator())
             res = dev.sample_basis_states(number_of_states, state_probs)
 
-        assert np.array_equal(res[0], np.array([0, 1, 2, 3]))
-        assert res[1] == shots
-        assert res[2] == state_probs
+        assert np.array_equal(res, np.array([0, 1, 1, 3, 3]))
+
+    def test_zero_probability_states_not_sampled(self, mock_qubit_device):
+        """Tests that basis states with zero probability are never sampled"""
+        dev = mock_qubit_device()
+        dev.shots = 1000
+        state_probs = np.array([0, 0.5, 0, 0.5, 0, 0, 0, 0])
+
+        res = dev.sample_basis_states(8, state_probs)
+
+        assert set(np.unique(res)) == {1, 3}
+
+    def test_sample_frequencies(self, mock_qubit_device):
+        """Tests that the sampled basis states follow the state probability"""
+        dev = mock_qubit_device()
+        dev.shots = 100000
+        state_probs = np.array([0.1, 0.2, 0.3, 0.4])
+
+        res = dev.sample_basis_states(4, state_probs)
+
+        assert np.allclose(np.bincount(res, minlength=4) / dev.shots, state_probs, atol=0.01)
+
+    def test_round_off_not_sampled(self, mock_qubit_device):
+        """Tests that the floating point round-off of a single precision state
+        probability is not assigned to the last basis state"""
+        dev = mock_qubit_device()
+        dev.shots = 1000
+        state_probs = np.array([0.5, 0.5, 0, 0], dtype=np.float32) * np.float32(0.9999997)
+
+        class MockGenerator:
+            """Mock random number generator returning values close to one"""
+
+            @staticmethod
+            def random(size):
+                return np.linspace(0.9999, 1, size, endpoint=False)
+
+        dev._rng = MockGenerator()
+        res = dev.sample_basis_states(4, state_probs)
+
+        assert np.all(res == 1)
+
+    @pytest.mark.parametrize(
+        "state_probs,msg",
+        [
+            ([0.6, -0.1, 0.5], "not non-negative"),
+            ([0.1, 0.2, 0.3], "do not sum to 1"),
+            ([0.5, 0.5, 0.5], "do not sum to 1"),
+        ],
+    )
+    def test_invalid_probabilities(self, mock_qubit_device, state_probs, msg):
+        """Tests that an error is raised if the state probability is negative
+        or not normalized"""
+        dev = mock_qubit_device()
+        dev.shots = 10
+
+        with pytest.raises(ValueError, match=msg):
+            dev.sample_basis_states(3, state_probs)
+
+    def test_seeded_samples_reproducible(self, mock_qubit_device_with_original_statistics):
+        """Tests that devices created with the same seed generate the same samples"""
+        state_probs = np.array([0.1, 0.2, 0.3, 0.4])
+
+        dev1 = QubitDevice(wires=2, seed=1234)
+        dev2 = QubitDevice(wires=2, seed=1234)
+        dev3 = QubitDevice(wires=2, seed=4321)
+
+        res1 = dev1.sample_basis_states(4, state_probs)
+        res2 = dev2.sample_basis_states(4, state_probs)
+        res3 = dev3.sample_basis_states(4, state_probs)
+
+        assert np.array_equal(res1, res2)
+        assert not np.array_equal(res1, res3)
 
 
 class TestStatesToBinary:
@@ -457,6 +608,76 @@ class TestStatesToBinary:
         res = dev.states_to_binary(samples, wires)
         assert np.allclose(res, binary_states, atol=tol, rtol=0)
 
+    def test_binary_states_dtype(self, mock_qubit_device):
+        """Tests that the states_to_binary method returns unsigned 8-bit integers by
+        default, and that the number of wires may exceed a single byte"""
+        wires = 10
+        samples = np.array([0, 1, 512, 1023, 768])
+
+        dev = mock_qubit_device()
+        res = dev.states_to_binary(samples, wires)
+
+        format_smt = "{{:0{}b}}".format(wires)
+        expected = np.array([[int(x) for x in list(format_smt.format(i))] for i in samples])
+
+        assert res.dtype == np.uint8
+        assert np.array_equal(res, expected)
+
+    @pytest.mark.parametrize("wires", [2, 8, 9, 40])
+    def test_binary_states_contiguous(self, mock_qubit_device, wires):
+        """Tests that the states_to_binary method returns a contiguous array that
+        stores a single byte per wire and sample"""
+        samples = np.array([0, 1, 2, 3, 2 ** wires - 1])
+
+        dev = mock_qubit_device()
+        res = dev.states_to_binary(samples, wires)
+
+        assert res.flags.c_contiguous
+        assert res.base is None
+        assert res.nbytes == len(samples) * wires
+        assert np.array_equal(res[-1], np.ones(wires))
+        assert np.array_equal(res[1], np.eye(wires)[-1])
+
+
+class TestPackBits:
+    """Test the _pack_bits function"""
+
+    @pytest.mark.parametrize("samples, binary_states", TestStatesToBinary.test_binary_conversion_data)
+    def test_correct_conversion(self, samples, binary_states):
+        """Tests that _pack_bits converts binary samples to base 10 correctly"""
+        res = _pack_bits(binary_states.astype(np.uint8), binary_states.shape[1])
+        assert np.array_equal(res, samples)
+
+    def test_powers_of_two_cached(self):
+        """Tests that the powers of two are cached and read-only"""
+        res = _powers_of_two(4)
+
+        assert np.array_equal(res, [8, 4, 2, 1])
+        assert _powers_of_two(4) is res
+        assert not res.flags.writeable
+
+    @pytest.mark.parametrize(
+        "num_bits, dtype", [(1, np.uint8), (8, np.uint8), (9, np.uint16), (32, np.uint32), (33, np.int64)]
+    )
+    def test_narrowest_dtype(self, num_bits, dtype):
+        """Tests that samples are packed in the narrowest integer type able to
+        represent them"""
+        samples = np.ones((3, num_bits), dtype=np.uint8)
+        res = _pack_bits(samples, num_bits)
+
+        assert res.dtype == dtype
+        assert np.all(res == 2 ** num_bits - 1)
+
+    def test_inverse_of_states_to_binary(self, mock_qubit_device):
+        """Tests that _pack_bits inverts the states_to_binary method"""
+        wires = 40
+        samples = np.array([0, 1, 2 ** 39, 2 ** 40 - 1, 123456789012])
+
+        dev = mock_qubit_device()
+        res = _pack_bits(dev.states_to_binary(samples, wires), wires)
+
+        assert np.array_equal(res, samples)
+
 
 class TestExpval:
     """Test the expval method"""
@@ -481,6 +702,23 @@ class TestExpval:
 
         assert res == (obs.eigvals @ probs).real
 
+    @pytest.mark.parametrize("obs", [qml.PauliX(0), qml.PauliY(0), qml.PauliZ(0), qml.Hadamard(0)])
+    def test_analytic_expval_pauli(self, obs, mock_qubit_device_with_original_statistics, monkeypatch):
+        """Tests that the expval method of single-qubit Pauli observables does not
+        require the eigenvalues of the observable"""
+        probs = np.array([0.2, 0.8])
+        dev = mock_qubit_device_with_original_statistics()
+
+        def raise_error(*args):
+            raise ValueError("Eigenvalues accessed")
+
+        with monkeypatch.context() as m:
+            m.setattr(QubitDevice, "probability", lambda self, wires=None: probs)
+            m.setattr(QubitDevice, "_get_eigvals", raise_error)
+            res = dev.expval(obs)
+
+        assert np.isclose(res, -0.6)
+
     def test_non_analytic_expval(self, mock_qubit_device_with_original_statistics, monkeypatch):
         """Tests that expval method when the analytic attribute is False
 
@@ -529,6 +767,23 @@ class TestVar:
 
         assert res == (obs.eigvals ** 2) @ probs - (obs.eigvals @ probs).real ** 2
 
+    @pytest.mark.parametrize("obs", [qml.PauliX(0), qml.PauliY(0), qml.PauliZ(0), qml.Hadamard(0)])
+    def test_analytic_var_pauli(self, obs, mock_qubit_device_with_original_statistics, monkeypatch):
+        """Tests that the var method of single-qubit Pauli observables does not
+        require the eigenvalues of the observable"""
+        probs = np.array([0.2, 0.8])
+        dev = mock_qubit_device_with_original_statistics()
+
+        def raise_error(*args):
+            raise ValueError("Eigenvalues accessed")
+
+        with monkeypatch.context() as m:
+            m.setattr(QubitDevice, "probability", lambda self, wires=None: probs)
+            m.setattr(QubitDevice, "_get_eigvals", raise_error)
+            res = dev.var(obs)
+
+        assert np.isclose(res, 1 - 0.6 ** 2)
+
     def test_non_analytic_var(self, mock_qubit_device_with_original_statistics, monkeypatch):
         """Tests that var method when the analytic attribute is False
 
@@ -554,6 +809,116 @@ class TestVar:
         assert res == obs
 
 
+class TestEigvalsCache:
+    """Test the caching of observable eigenvalues"""
+
+    def test_eigvals_reused(self, mocker):
+        """Test that the eigenvalues of an observable are computed once
+        for repeated executions of the same circuit"""
+        dev = qml.device("default.qubit", wires=1)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.543, wires=0)
+            qml.expval(qml.Hermitian(np.array([[1, 2j], [-2j, 0]]), wires=0))
+
+        spy = mocker.patch.object(
+            qml.Hermitian,
+            "eigvals",
+            new_callable=mocker.PropertyMock,
+            return_value=np.linalg.eigvalsh([[1, 2j], [-2j, 0]]),
+        )
+
+        res1 = dev.execute(tape)
+        num_calls = spy.call_count
+        assert num_calls > 0
+
+        dev.reset()
+        res2 = dev.execute(tape)
+
+        assert spy.call_count == num_calls
+        assert np.allclose(res1, res2)
+        assert len(dev._eigvals_cache) == 1
+
+    def test_eigvals_reused_across_tapes(self, mocker):
+        """Test that the eigenvalues of an observable are reused by executions of
+        different tapes measuring the same observable object"""
+        dev = qml.device("default.qubit", wires=1)
+        obs = qml.Hermitian(np.array([[1, 2j], [-2j, 0]]), wires=0)
+
+        with qml.tape.QuantumTape() as tape1:
+            qml.RX(0.543, wires=0)
+            qml.expval(obs)
+
+        with qml.tape.QuantumTape() as tape2:
+            qml.RY(-0.654, wires=0)
+            qml.expval(obs)
+
+        spy = mocker.patch.object(
+            qml.Hermitian,
+            "eigvals",
+            new_callable=mocker.PropertyMock,
+            return_value=np.linalg.eigvalsh([[1, 2j], [-2j, 0]]),
+        )
+
+        dev.execute(tape1)
+        num_calls = spy.call_count
+
+        dev.reset()
+        res = dev.execute(tape2)
+
+        assert spy.call_count == num_calls
+        assert np.allclose(res, qml.device("default.qubit", wires=1).execute(tape2))
+
+    def test_squared_eigvals_cached(self):
+        """Test that the squared eigenvalues used to compute the variance of an
+        observable are cached alongside its eigenvalues"""
+        dev = qml.device("default.qubit", wires=1)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.Hadamard(wires=0)
+            qml.var(qml.Hermitian(np.diag([1, 3]), wires=0))
+
+        assert np.allclose(dev.execute(tape), 1)
+        (entry,) = dev._eigvals_cache.values()
+        assert np.allclose(entry[3], [1, 9])
+
+        dev.reset()
+        assert np.allclose(dev.execute(tape), 1)
+        assert next(iter(dev._eigvals_cache.values()))[3] is entry[3]
+
+    def test_eigvals_recomputed_for_new_parameters(self):
+        """Test that the eigenvalues of an observable are recomputed if
+        its parameters change"""
+        dev = qml.device("default.qubit", wires=1)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.expval(qml.Hermitian(np.diag([1, 2]), wires=0))
+
+        assert np.allclose(dev.execute(tape), 1)
+
+        tape.set_parameters([np.diag([3, 2])], trainable_only=False)
+        dev.reset()
+        assert np.allclose(dev.execute(tape), 3)
+
+    def test_eigvals_cache_discarded(self):
+        """Test that cached eigenvalues of observables not measured by the
+        executed circuit are discarded"""
+        dev = qml.device("default.qubit", wires=1)
+
+        with qml.tape.QuantumTape() as tape1:
+            qml.expval(qml.Hermitian(np.diag([1, 2]), wires=0))
+
+        with qml.tape.QuantumTape() as tape2:
+            qml.expval(qml.Hermitian(np.diag([3, 4]), wires=0))
+
+        dev.execute(tape1)
+        assert [v[0] for v in dev._eigvals_cache.values()] == tape1.observables
+
+        dev.reset()
+        dev.execute(tape2)
+        assert [v[0] for v in dev._eigvals_cache.values()] == tape2.observables
+
+
 class TestSample:
     """Test the sample method"""
 
@@ -584,6 +949,141 @@ class TestSample:
         assert np.array_equal(res, np.array([-1, 1]))
 
 
+class TestFastLocalSample:
+    """Test that samples are generated independently for each wire when
+    only single-qubit Pauli observables are estimated"""
+
+    def test_local_samples_generated(self, mocker, tol):
+        """Test that the full computational basis samples are not generated when
+        estimating single-qubit Pauli observables"""
+        dev = qml.device("default.qubit", wires=3, shots=10000, analytic=False)
+        spy = mocker.spy(QubitDevice, "generate_samples")
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.543, wires=0)
+            qml.RY(-0.654, wires=1)
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.PauliZ(0))
+            qml.var(qml.PauliX(1))
+            qml.expval(qml.PauliZ(2))
+
+        res = dev.execute(tape)
+        spy.assert_not_called()
+
+        assert dev._samples is None
+        assert set(dev._samples_col) == {0, 1, 2}
+        assert all(s.shape == (10000,) for s in dev._samples_col.values())
+
+        dev_analytic = qml.device("default.qubit", wires=3)
+        expected = dev_analytic.execute(tape)
+        assert np.allclose(res, expected, atol=0.05, rtol=0)
+
+    @pytest.mark.parametrize(
+        "measurement",
+        [
+            lambda: qml.sample(qml.PauliZ(0)),
+            lambda: qml.probs(wires=[0]),
+            lambda: qml.expval(qml.PauliZ(0) @ qml.PauliZ(1)),
+            lambda: qml.expval(qml.Hermitian(np.diag([1, 2]), wires=0)),
+        ],
+    )
+    def test_full_samples_generated(self, mocker, measurement):
+        """Test that the full computational basis samples are generated if any
+        of the measured statistics does not allow for local sampling"""
+        dev = qml.device("default.qubit", wires=2, shots=10, analytic=False)
+        spy = mocker.spy(QubitDevice, "generate_samples")
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.543, wires=0)
+            qml.expval(qml.PauliZ(1))
+            measurement()
+
+        dev.execute(tape)
+        spy.assert_called_once()
+
+        assert dev._samples.shape == (10, 2)
+        assert dev._samples_col is None
+
+    def test_full_samples_generated_few_shots(self, mocker):
+        """Test that the full computational basis samples are generated if the number
+        of sampled bits does not exceed the number of basis states"""
+        dev = qml.device("default.qubit", wires=10, shots=100, analytic=False)
+        spy = mocker.spy(QubitDevice, "generate_samples")
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.543, wires=0)
+            qml.expval(qml.PauliZ(0))
+            qml.expval(qml.PauliZ(9))
+
+        dev.execute(tape)
+        spy.assert_called_once()
+
+        assert dev._samples.shape == (100, 10)
+        assert dev._samples_col is None
+
+    def test_local_marginals_custom_wires(self, tol):
+        """Test that the per-wire samples correspond to the marginal probabilities
+        of the measured wires when using custom wire labels"""
+        dev = qml.device("default.qubit", wires=["a", 3, "c"], shots=10000, analytic=False, seed=1)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.PauliX(wires=3)
+            qml.RY(np.pi / 3, wires="c")
+            qml.expval(qml.PauliZ(3))
+            qml.expval(qml.PauliZ("c"))
+            qml.expval(qml.PauliZ("a"))
+
+        res = dev.execute(tape)
+
+        assert set(dev._samples_col) == {0, 1, 2}
+        assert np.allclose(res, [-1, 0.5, 1], atol=0.05, rtol=0)
+
+
+class TestAnalyticProbCache:
+    """Test that the analytic probability is shared between the observables
+    measured during an execution"""
+
+    def test_analytic_probability_computed_once(self, mocker, tol):
+        """Test that the analytic probability of all wires is computed once per execution"""
+        dev = qml.device("default.qubit", wires=3)
+        spy = mocker.spy(dev, "analytic_probability")
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.543, wires=0)
+            qml.RY(-0.654, wires=1)
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.PauliZ(0))
+            qml.var(qml.PauliZ(1))
+            qml.probs(wires=[1, 0])
+            qml.expval(qml.PauliZ(2))
+
+        res = dev.execute(tape)
+
+        spy.assert_called_once_with()
+        assert dev._analytic_prob_cache is None
+
+        # statistics computed outside of an execution do not use the cache
+        expected = dev.statistics(tape.observables)
+        assert spy.call_count == 1 + len(tape.observables)
+
+        for r, e in zip(res, expected):
+            assert np.allclose(r, e, atol=tol, rtol=0)
+
+    def test_no_cache_outside_execution(self, mocker):
+        """Test that the analytic probability is recomputed when requested
+        outside of an execution"""
+        dev = qml.device("default.qubit", wires=2)
+        spy = mocker.spy(dev, "analytic_probability")
+
+        dev.apply([qml.PauliX(wires=0)])
+        assert np.allclose(dev.probability(wires=[0]), [0, 1])
+
+        dev.apply([qml.PauliX(wires=0)])
+        assert np.allclose(dev.probability(wires=[0]), [1, 0])
+
+        assert spy.call_count == 2
+
+
 class TestEstimateProb:
     """Test the estimate_probability method"""
 
@@ -603,6 +1103,74 @@ class TestEstimateProb:
 
         assert np.allclose(res, expected)
 
+    @pytest.mark.parametrize("wires", [[0], [2, 0], None])
+    def test_estimate_probability_numba(
+        self, wires, mock_qubit_device_with_original_statistics, monkeypatch, mocker, tol
+    ):
+        """Tests that the Numba-compiled histogram agrees with the NumPy implementation"""
+        pytest.importorskip("numba")
+        spy = mocker.spy(qml._qubit_device, "_numba_hist_from_bits")
+
+        dev = mock_qubit_device_with_original_statistics(wires=3)
+        samples = (np.random.random((5000, 3)) < [0.2, 0.5, 0.7]).astype(np.uint8)
+
+        with monkeypatch.context() as m:
+            m.setattr(dev, "_samples", samples)
+            m.setattr(dev, "shots", 5000)
+            res = dev.estimate_probability(wires=wires)
+            spy.assert_called_once()
+
+            m.setattr(qml._qubit_device, "_numba_hist_from_bits", lambda: None)
+            expected = dev.estimate_probability(wires=wires)
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("shots", [1, 7, 9, 1000])
+    def test_hist_from_bits_python(self, shots, monkeypatch, mocker):
+        """Tests that the Python implementation of the Numba-compiled histogram
+        counts the occurrences of each basis state, using at most as many
+        histogram entries as there are samples"""
+        pytest.importorskip("numba")
+        kernels = pytest.importorskip("pennylane._numba_kernels")
+        monkeypatch.setattr(
+            kernels, "_chunked_hist_from_bits", kernels._chunked_hist_from_bits.py_func
+        )
+        spy = mocker.spy(np, "zeros")
+
+        bits = (np.random.random((shots, 3)) < 0.5).astype(np.uint8)
+        res = kernels.hist_from_bits(bits, 3, shots)
+
+        assert np.array_equal(res, np.bincount(_pack_bits(bits, 3), minlength=8))
+
+        num_chunks, num_states = spy.call_args[0][0]
+        assert num_states == 8
+        assert num_chunks == 1 or num_chunks * num_states <= shots
+
+    def test_numba_not_imported(self):
+        """Tests that importing PennyLane does not import Numba"""
+        code = "import sys, pennylane; assert 'numba' not in sys.modules"
+
+        # avoid forking this process, which may deadlock if Numba has already
+        # started the threads of the TBB threading layer
+        subprocess.run([sys.executable, "-c", code], check=True, close_fds=False)
+
+    def test_numba_cache_error(self, monkeypatch):
+        """Tests that the NumPy implementation is used if Numba fails to
+        compile the histogram"""
+        numba = pytest.importorskip("numba")
+
+        def njit(*args, **kwargs):
+            raise RuntimeError("cannot cache function: no locator available")
+
+        qml._qubit_device._numba_hist_from_bits.cache_clear()
+
+        with monkeypatch.context() as m:
+            m.setattr(numba, "njit", njit)
+            m.delitem(sys.modules, "pennylane._numba_kernels", raising=False)
+            assert qml._qubit_device._numba_hist_from_bits() is None
+
+        qml._qubit_device._numba_hist_from_bits.cache_clear()
+
 
 class TestMarginalProb:
     """Test the marginal_prob method"""
@@ -640,6 +1208,57 @@ class TestMarginalProb:
         assert np.allclose(array_call.flatten(), probs, atol=tol, rtol=0)
         assert axis_call == tuple(inactive_wires)
 
+    def test_single_reduction_over_inactive_wires(
+        self, mock_qubit_device_with_original_statistics, mocker
+    ):
+        """Test that the inactive wires are summed over in a single reduction,
+        rather than one reduction per inactive wire"""
+        probs = np.array([random() for i in range(2 ** 6)])
+        probs /= sum(probs)
+
+        dev = mock_qubit_device_with_original_statistics(wires=6)
+        spy = mocker.spy(np, "sum")
+        dev.marginal_prob(probs, wires=[4, 1])
+
+        assert spy.call_count == 1
+        assert spy.call_args[1]["axis"] == (0, 2, 3, 5)
+
+    @pytest.mark.parametrize(
+        "inactive_wires",
+        [[], [0], [5], [1, 2], [0, 2, 4], [0, 1, 3, 4], [0, 1, 2, 3, 4, 5]],
+    )
+    def test_fold_marginalize(self, inactive_wires, tol):
+        """Test that folding the probability over the inactive wires agrees
+        with a multi-axis reduction"""
+        probs = np.array([random() for i in range(2 ** 6)])
+        probs /= sum(probs)
+        probs = probs.reshape([2] * 6)
+
+        res = _fold_marginalize(probs, 6, inactive_wires)
+        expected = np.sum(probs, axis=tuple(inactive_wires))
+
+        assert res.shape == expected.shape
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_fold_marginalize_many_wires(
+        self, mock_qubit_device_with_original_statistics, mocker, tol
+    ):
+        """Test that the correct marginals are returned for a large number of wires,
+        where the probability is folded over the inactive wires"""
+        num_wires = 18
+        probs = np.random.random(2 ** num_wires)
+        probs /= sum(probs)
+
+        dev = mock_qubit_device_with_original_statistics(wires=num_wires)
+        spy = mocker.spy(np, "sum")
+        res = dev.marginal_prob(probs, wires=[16, 3, 4])
+
+        expected = np.einsum(probs.reshape([2] * num_wires), list(range(num_wires)), [16, 3, 4])
+        assert np.allclose(res, expected.flatten(), atol=tol, rtol=0)
+
+        # only the runs of more than one consecutive inactive wire are reduced by np.sum
+        assert spy.call_count == 2
+
     marginal_test_data = [
         (np.array([0.1, 0.2, 0.3, 0.4]), np.array([0.4, 0.6]), [1]),
         (np.array([0.1, 0.2, 0.3, 0.4]), np.array([0.3, 0.7]), Wires([0])),
@@ -699,6 +1318,28 @@ class TestActiveWires:
 
         assert res == Wires([0, 2, 5])
 
+    def test_active_wires_mask_from_queue(self, mock_qubit_device):
+        """Test that the active wires bitmask is correctly computed"""
+        queue = [
+            qml.CNOT(wires=[0, 2]),
+            qml.RX(0.2, wires=0),
+            qml.expval(qml.PauliX(wires=5))
+        ]
+
+        dev = mock_qubit_device(wires=6)
+        res = dev.active_wires_mask(queue)
+
+        assert res == 0b100101
+
+    def test_active_wires_mask_custom_labels(self, mock_qubit_device):
+        """Test that the active wires bitmask uses the device's internal wire labels"""
+        queue = [qml.CNOT(wires=["c", "a"])]
+
+        dev = QubitDevice(wires=["a", "b", "c"])
+        res = dev.active_wires_mask(queue)
+
+        assert res == 0b101
+
 
 class TestCapabilities:
     """Test that a default qubit device defines capabilities that all devices inheriting